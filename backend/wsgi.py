@@ -0,0 +1,19 @@
+"""
+WSGI entry point for production servers.
+
+Run with gunicorn + gevent workers so database-blocking handlers yield to
+other greenlets instead of serializing behind a single thread:
+
+    GEVENT_MONKEY_PATCH=1 gunicorn -k gevent -w 4 \
+        --worker-connections 1000 -b 0.0.0.0:5000 wsgi:app
+
+GEVENT_MONKEY_PATCH=1 makes app.py patch the stdlib before any
+socket-using import. The connection pools in app.py are created lazily on
+first request, so each gunicorn worker builds its own sockets after the
+fork instead of inheriting shared ones.
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run()
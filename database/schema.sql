@@ -32,10 +32,228 @@ CREATE TABLE trips (
 );
 
 -- Indexes for efficient querying
-CREATE INDEX idx_trips_vendor ON trips(vendor_id);
-CREATE INDEX idx_trips_pickup_location ON trips(pickup_location_id);
+-- The route pair covers the popular-routes GROUP BY (pickup, dropoff)
+-- from the index alone and subsumes a single-column pickup_location_id
+-- index via its leftmost prefix.
+CREATE INDEX idx_trips_route ON trips(pickup_location_id, dropoff_location_id);
 CREATE INDEX idx_trips_dropoff_location ON trips(dropoff_location_id);
-CREATE INDEX idx_trips_passenger_count ON trips(passenger_count);
+-- Supports keyset pagination ordered by (pickup_time, trip_id)
+CREATE INDEX idx_trips_pickup_time ON trips(pickup_time, trip_id);
+-- Composite indexes matching the /api/trips filter + ORDER BY shapes:
+-- equality column first, then pickup_time so the ORDER BY pickup_time DESC
+-- becomes a backward index scan instead of a filesort. These subsume the
+-- old single-column vendor_id / passenger_count indexes (leftmost prefix).
+CREATE INDEX idx_trips_vendor_time ON trips(vendor_id, pickup_time);
+CREATE INDEX idx_trips_passenger_time ON trips(passenger_count, pickup_time);
+-- Range filters on trip duration (min_duration / max_duration)
+CREATE INDEX idx_trips_duration ON trips(trip_duration);
+
+-- Materialized summary tables for the statistics endpoints. The dashboard
+-- aggregates are tiny (24 hourly rows, 7 daily, 2 rush-hour/weekend) but
+-- were recomputed from the full trips table on every request; these tables
+-- hold the precomputed results and are refreshed by refresh_stats() below.
+CREATE TABLE stats_hourly (
+    hour INT PRIMARY KEY,
+    trip_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(4,1)
+);
+
+CREATE TABLE stats_daily (
+    day_of_week INT PRIMARY KEY,
+    day_name VARCHAR(9),
+    trip_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(5,2)
+);
+
+CREATE TABLE stats_rush_hour (
+    is_rush_hour TINYINT PRIMARY KEY,
+    trip_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(5,2)
+);
+
+CREATE TABLE stats_weekend (
+    is_weekend TINYINT PRIMARY KEY,
+    period VARCHAR(7),
+    trip_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(5,2)
+);
+
+-- Per-day, per-hour rollup with additive sums (not averages), so any
+-- date-range query can be answered by re-aggregating a few thousand tiny
+-- rows instead of re-scanning trips with per-row HOUR()/DAYOFWEEK() calls.
+CREATE TABLE trips_rollup_hourly (
+    date DATE NOT NULL,
+    hour INT NOT NULL,
+    day_of_week INT NOT NULL,
+    is_rush_hour TINYINT NOT NULL,
+    is_weekend TINYINT NOT NULL,
+    trip_count INT NOT NULL,
+    sum_duration BIGINT NOT NULL,
+    sum_passengers BIGINT NOT NULL,
+    PRIMARY KEY (date, hour)
+);
+
+CREATE TABLE stats_vendor (
+    vendor_id INT PRIMARY KEY,
+    trip_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(5,2)
+);
+
+-- Hourly-materialized location rankings: the popular-location endpoints
+-- become an O(limit) primary-key range read (WHERE ranking <= N) instead
+-- of a full trips GROUP BY per request. 1000 rows is far beyond the API
+-- limit caps, leaving headroom for bigger panels.
+CREATE TABLE top_pickup_locations (
+    ranking INT PRIMARY KEY,
+    location_id INT NOT NULL,
+    pickup_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(4,1)
+);
+
+CREATE TABLE top_dropoff_locations (
+    ranking INT PRIMARY KEY,
+    location_id INT NOT NULL,
+    dropoff_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(4,1)
+);
+
+CREATE TABLE top_routes (
+    ranking INT PRIMARY KEY,
+    pickup_location_id INT NOT NULL,
+    dropoff_location_id INT NOT NULL,
+    route_count INT NOT NULL,
+    avg_duration INT,
+    avg_passengers DECIMAL(4,1)
+);
+
+DELIMITER //
+CREATE PROCEDURE refresh_stats()
+BEGIN
+    TRUNCATE stats_hourly;
+    INSERT INTO stats_hourly
+    SELECT HOUR(pickup_time), COUNT(*), ROUND(AVG(trip_duration), 0),
+           ROUND(AVG(passenger_count), 1)
+    FROM trips GROUP BY HOUR(pickup_time);
+
+    TRUNCATE stats_daily;
+    INSERT INTO stats_daily
+    SELECT DAYOFWEEK(pickup_time),
+           CASE DAYOFWEEK(pickup_time)
+               WHEN 1 THEN 'Sunday' WHEN 2 THEN 'Monday' WHEN 3 THEN 'Tuesday'
+               WHEN 4 THEN 'Wednesday' WHEN 5 THEN 'Thursday'
+               WHEN 6 THEN 'Friday' WHEN 7 THEN 'Saturday'
+           END,
+           COUNT(*), ROUND(AVG(trip_duration), 0), ROUND(AVG(passenger_count), 2)
+    FROM trips GROUP BY DAYOFWEEK(pickup_time);
+
+    TRUNCATE stats_rush_hour;
+    INSERT INTO stats_rush_hour
+    SELECT CASE WHEN HOUR(pickup_time) IN (7,8,17,18) THEN 1 ELSE 0 END,
+           COUNT(*), ROUND(AVG(trip_duration), 0), ROUND(AVG(passenger_count), 2)
+    FROM trips GROUP BY 1;
+
+    TRUNCATE stats_weekend;
+    INSERT INTO stats_weekend
+    SELECT CASE WHEN DAYOFWEEK(pickup_time) IN (1,7) THEN 1 ELSE 0 END,
+           CASE WHEN DAYOFWEEK(pickup_time) IN (1,7) THEN 'Weekend' ELSE 'Weekday' END,
+           COUNT(*), ROUND(AVG(trip_duration), 0), ROUND(AVG(passenger_count), 2)
+    FROM trips GROUP BY 1, 2;
+
+    TRUNCATE trips_rollup_hourly;
+    INSERT INTO trips_rollup_hourly
+    SELECT DATE(pickup_time), HOUR(pickup_time), DAYOFWEEK(pickup_time),
+           CASE WHEN HOUR(pickup_time) IN (7,8,17,18) THEN 1 ELSE 0 END,
+           CASE WHEN DAYOFWEEK(pickup_time) IN (1,7) THEN 1 ELSE 0 END,
+           COUNT(*), SUM(trip_duration), SUM(passenger_count)
+    FROM trips GROUP BY 1, 2, 3, 4, 5;
+
+    TRUNCATE stats_vendor;
+    INSERT INTO stats_vendor
+    SELECT vendor_id, COUNT(*), ROUND(AVG(trip_duration), 0),
+           ROUND(AVG(passenger_count), 2)
+    FROM trips GROUP BY vendor_id;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE PROCEDURE refresh_top_locations()
+BEGIN
+    TRUNCATE top_pickup_locations;
+    INSERT INTO top_pickup_locations
+    SELECT ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC), pickup_location_id,
+           COUNT(*), ROUND(AVG(trip_duration), 0), ROUND(AVG(passenger_count), 1)
+    FROM trips GROUP BY pickup_location_id
+    ORDER BY COUNT(*) DESC LIMIT 1000;
+
+    TRUNCATE top_dropoff_locations;
+    INSERT INTO top_dropoff_locations
+    SELECT ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC), dropoff_location_id,
+           COUNT(*), ROUND(AVG(trip_duration), 0), ROUND(AVG(passenger_count), 1)
+    FROM trips GROUP BY dropoff_location_id
+    ORDER BY COUNT(*) DESC LIMIT 1000;
+
+    TRUNCATE top_routes;
+    INSERT INTO top_routes
+    SELECT ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC),
+           pickup_location_id, dropoff_location_id,
+           COUNT(*), ROUND(AVG(trip_duration), 0), ROUND(AVG(passenger_count), 1)
+    FROM trips GROUP BY pickup_location_id, dropoff_location_id
+    ORDER BY COUNT(*) DESC LIMIT 1000;
+END //
+DELIMITER ;
+
+-- Returns the three location-panel aggregations as consecutive result
+-- sets, so the API serves /api/locations/all with one CALL and the
+-- buffer pool warms once instead of three times. Results carry integer
+-- location IDs; clients resolve coordinates via /api/locations/catalog.
+DELIMITER //
+CREATE PROCEDURE sp_location_summary(IN lim INT, IN route_lim INT)
+BEGIN
+    SELECT pickup_location_id AS location_id,
+           COUNT(*) AS pickup_count,
+           ROUND(AVG(trip_duration), 0) AS avg_duration,
+           ROUND(AVG(passenger_count), 1) AS avg_passengers
+    FROM trips
+    GROUP BY pickup_location_id
+    ORDER BY pickup_count DESC
+    LIMIT lim;
+
+    SELECT dropoff_location_id AS location_id,
+           COUNT(*) AS dropoff_count,
+           ROUND(AVG(trip_duration), 0) AS avg_duration,
+           ROUND(AVG(passenger_count), 1) AS avg_passengers
+    FROM trips
+    GROUP BY dropoff_location_id
+    ORDER BY dropoff_count DESC
+    LIMIT lim;
+
+    SELECT pickup_location_id, dropoff_location_id,
+           COUNT(*) AS route_count,
+           ROUND(AVG(trip_duration), 0) AS avg_duration,
+           ROUND(AVG(passenger_count), 1) AS avg_passengers
+    FROM trips
+    GROUP BY pickup_location_id, dropoff_location_id
+    ORDER BY route_count DESC
+    LIMIT route_lim;
+END //
+DELIMITER ;
+
+-- Requires the event scheduler (SET GLOBAL event_scheduler = ON)
+CREATE EVENT IF NOT EXISTS refresh_stats_event
+ON SCHEDULE EVERY 10 MINUTE
+DO CALL refresh_stats();
+
+-- The location rankings drift slowly, so an hourly refresh is plenty.
+CREATE EVENT IF NOT EXISTS refresh_top_locations_event
+ON SCHEDULE EVERY 1 HOUR
+DO CALL refresh_top_locations();
 
 -- View for easy querying with all denormalized data
 CREATE OR REPLACE VIEW trip_details AS
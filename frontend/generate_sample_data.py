@@ -4,9 +4,16 @@ This simulates what your backend API would return
 """
 
 import json
-import random
+import numpy as np
 from datetime import datetime, timedelta
 
+# orjson writes these files ~5-10x faster than stdlib json; fall back
+# silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def generate_summary_data():
     """Generate summary metrics (KPIs)"""
     return {
@@ -65,28 +72,29 @@ def generate_duration_distribution():
 
 def generate_scatter_data(num_points=200):
     """Generate distance vs duration scatter plot data"""
-    data = []
-    
-    for i in range(num_points):
-        # Distance between 0.5 and 30 miles
-        distance = random.uniform(0.5, 30)
-        
-        # Duration roughly proportional to distance with some variance
-        # Average speed around 15 mph in city
-        base_duration = (distance / 15) * 60  # Convert to minutes
-        
-        # Add realistic variance
-        duration = base_duration * random.uniform(0.7, 1.5)
-        
-        # Add some traffic effect for shorter distances
-        if distance < 5:
-            duration *= random.uniform(1.0, 1.8)
-        
-        data.append({
-            "x": round(distance, 2),
-            "y": round(duration, 2)
-        })
-    
+    rng = np.random.default_rng()
+
+    # All points drawn at once instead of a Python loop with four
+    # random.uniform calls per point
+    # Distance between 0.5 and 30 miles
+    distance = rng.uniform(0.5, 30, num_points)
+
+    # Duration roughly proportional to distance with some variance
+    # Average speed around 15 mph in city
+    base_duration = (distance / 15) * 60  # Convert to minutes
+
+    # Add realistic variance
+    duration = base_duration * rng.uniform(0.7, 1.5, num_points)
+
+    # Add some traffic effect for shorter distances
+    short = distance < 5
+    duration[short] *= rng.uniform(1.0, 1.8, int(short.sum()))
+
+    data = [
+        {"x": float(x), "y": float(y)}
+        for x, y in zip(distance.round(2), duration.round(2))
+    ]
+
     return {"data": data}
 
 def generate_insights():
@@ -132,8 +140,12 @@ def save_all_sample_data():
     
     print("Generating sample data files...")
     for filename, data in data_files.items():
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
         print(f"✓ Created {filename}")
     
     print("\n✅ All sample data files generated successfully!")
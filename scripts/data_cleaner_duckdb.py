@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+One-statement DuckDB version of the cleaning pipeline in data_cleaner.py.
+
+The pandas cleaner materializes a full DataFrame per step (missing values,
+dedup, outliers, derived features) - four or five copies of the frame in
+memory, all single-threaded. DuckDB runs the same logic as one fused,
+vectorized SQL query that is parallelized across cores and streams from
+CSV straight to the output file, so there are no intermediate frames.
+
+This is the fast path for re-running the clean; data_cleaner.py remains
+the canonical implementation and the one that logs excluded records and
+the cleaning report. Both apply the same filters, so row counts match.
+
+Usage:
+    python scripts/data_cleaner_duckdb.py \
+        --csv data/train.csv --output data/cleaned_train_data.parquet
+
+An output ending in .csv writes CSV instead of parquet.
+"""
+
+import argparse
+import pathlib
+import time
+
+import duckdb
+
+# Mirrors data_cleaner.py: drop rows with missing critical fields, dedup
+# on (pickup_datetime, dropoff_datetime, pickup coords) keeping the first
+# row, drop non-positive / >24h durations, out-of-NYC or zero coordinates
+# and invalid passenger counts, then derive the analysis columns. The
+# train.csv export has no trip_distance/fare columns, so the distance- and
+# fare-derived features (guarded by column checks in the pandas cleaner)
+# do not apply here.
+CLEANING_SQL = """
+COPY (
+    SELECT
+        id,
+        vendor_id,
+        pickup_datetime,
+        dropoff_datetime,
+        passenger_count,
+        pickup_longitude,
+        pickup_latitude,
+        dropoff_longitude,
+        dropoff_latitude,
+        store_and_fwd_flag,
+        trip_duration,
+        CAST(epoch(dropoff_datetime - pickup_datetime) AS BIGINT)
+            AS trip_duration_seconds,
+        EXTRACT(hour FROM pickup_datetime) AS hour_of_day,
+        EXTRACT(isodow FROM pickup_datetime) - 1 AS day_of_week,
+        CASE
+            WHEN EXTRACT(hour FROM pickup_datetime) BETWEEN 6 AND 11 THEN 'morning'
+            WHEN EXTRACT(hour FROM pickup_datetime) BETWEEN 12 AND 17 THEN 'afternoon'
+            WHEN EXTRACT(hour FROM pickup_datetime) BETWEEN 18 AND 21 THEN 'evening'
+            ELSE 'night'
+        END AS time_period
+    FROM read_csv_auto(?)
+    WHERE pickup_datetime IS NOT NULL
+      AND dropoff_datetime IS NOT NULL
+      AND pickup_longitude IS NOT NULL AND pickup_latitude IS NOT NULL
+      AND dropoff_longitude IS NOT NULL AND dropoff_latitude IS NOT NULL
+      AND epoch(dropoff_datetime - pickup_datetime) > 0
+      AND epoch(dropoff_datetime - pickup_datetime) <= 86400
+      AND pickup_latitude BETWEEN 40.5 AND 41.0
+      AND pickup_longitude BETWEEN -74.3 AND -73.7
+      AND dropoff_latitude BETWEEN 40.5 AND 41.0
+      AND dropoff_longitude BETWEEN -74.3 AND -73.7
+      AND pickup_latitude != 0 AND pickup_longitude != 0
+      AND dropoff_latitude != 0 AND dropoff_longitude != 0
+      AND passenger_count > 0 AND passenger_count <= 7
+    QUALIFY row_number() OVER (
+        PARTITION BY pickup_datetime, dropoff_datetime,
+                     pickup_longitude, pickup_latitude
+        ORDER BY id
+    ) = 1
+    ORDER BY pickup_datetime
+) TO '{output}' ({options})
+"""
+
+
+def clean(input_csv, output_file):
+    """Runs the fused cleaning query, returning (rows_written, seconds)."""
+    output_file = pathlib.Path(output_file)
+    if output_file.suffix == '.csv':
+        options = "FORMAT CSV, HEADER"
+    else:
+        options = "FORMAT PARQUET, COMPRESSION SNAPPY"
+
+    sql = CLEANING_SQL.format(output=output_file.as_posix(), options=options)
+
+    start = time.time()
+    con = duckdb.connect()  # in-process, no server
+    try:
+        con.execute(sql, [str(input_csv)])
+        rows = con.execute(
+            "SELECT count(*) FROM read_csv_auto(?)"
+            if output_file.suffix == '.csv'
+            else "SELECT count(*) FROM read_parquet(?)",
+            [output_file.as_posix()]
+        ).fetchone()[0]
+    finally:
+        con.close()
+    return rows, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Clean NYC taxi data with a single DuckDB query'
+    )
+    parser.add_argument('--csv', default='data/train.csv',
+                        help='Path to the raw train.csv')
+    parser.add_argument('--output', default='data/cleaned_train_data.parquet',
+                        help='Output file (.parquet or .csv)')
+    args = parser.parse_args()
+
+    print(f"Cleaning {args.csv} -> {args.output} ...")
+    rows, elapsed = clean(args.csv, args.output)
+    print(f"Wrote {rows} cleaned records in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
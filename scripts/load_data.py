@@ -9,17 +9,28 @@ import sys
 import csv
 import math
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Tuple, Optional
-from datetime import datetime
 from dotenv import load_dotenv
 
 load_dotenv()
 
 import pymysql
+from pymysql.constants import CLIENT
 from pymysql.cursors import DictCursor
 
+# pyarrow parses and types whole CSV batches in native code, replacing the
+# dict-per-row csv.DictReader hot loop; the DictReader path remains the
+# fallback when pyarrow is not installed.
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
-def get_db_connection():
+
+def get_db_connection(local_infile: bool = False):
     host = os.getenv('DB_HOST', 'localhost')
     database = os.getenv('DB_NAME', 'nyc_taxi')
     user = os.getenv('DB_USER', 'root')
@@ -34,7 +45,11 @@ def get_db_connection():
         port=port,
         cursorclass=DictCursor,
         autocommit=False,
-        charset='utf8mb4'
+        charset='utf8mb4',
+        local_infile=local_infile,
+        # batches are highly repetitive text; compression cuts wire bytes
+        # several-fold for one cheap zlib pass per packet
+        client_flag=CLIENT.COMPRESS
     )
 
 
@@ -52,32 +67,462 @@ def ensure_vendor(cursor, vendor_id: int):
     cursor.execute("INSERT IGNORE INTO vendors (vendor_id) VALUES (%s)", (vendor_id,))
 
 
-def get_or_create_location(cursor, lon: float, lat: float) -> int:
-    cursor.execute(
-        "SELECT location_id FROM locations WHERE longitude=%s AND latitude=%s",
-        (lon, lat)
+def preload_vendors(cursor) -> set:
+    # the vendor set is tiny (two vendors in the NYC data); load it once
+    # so the hot loop never issues a per-row INSERT IGNORE
+    cursor.execute("SELECT vendor_id FROM vendors")
+    return {int(row['vendor_id']) for row in cursor.fetchall()}
+
+
+def pack_coords(lon: float, lat: float) -> int:
+    # coordinates are rounded to 7 decimals, so scaling by 1e7 yields
+    # exact 32-bit-sized integers; packing both into one int makes the
+    # cache key a single small int instead of a tuple of two floats
+    # (cheaper to hash and compare, roughly half the memory per entry)
+    return ((int(round(lon * 1e7)) & 0xFFFFFFFF) << 32) | (int(round(lat * 1e7)) & 0xFFFFFFFF)
+
+
+def preload_locations(cursor) -> Dict[int, int]:
+    # one query instead of a SELECT per CSV row; the whole table is a few
+    # tens of thousands of coordinate pairs
+    cursor.execute("SELECT location_id, longitude, latitude FROM locations")
+    return {
+        pack_coords(float(row['longitude']), float(row['latitude'])): int(row['location_id'])
+        for row in cursor.fetchall()
+    }
+
+
+def get_or_create_location(cursor, loc_cache: Dict[int, int],
+                           lon: float, lat: float) -> int:
+    key = pack_coords(lon, lat)
+    loc_id = loc_cache.get(key)
+    if loc_id is None:
+        # INSERT IGNORE + re-SELECT on conflict makes this safe when
+        # several loader processes race on the same new coordinate pair
+        cursor.execute(
+            "INSERT IGNORE INTO locations (longitude, latitude) VALUES (%s, %s)",
+            (lon, lat)
+        )
+        if cursor.rowcount:
+            loc_id = cursor.lastrowid
+        else:
+            cursor.execute(
+                "SELECT location_id FROM locations WHERE longitude=%s AND latitude=%s",
+                (lon, lat)
+            )
+            loc_id = int(cursor.fetchone()['location_id'])
+        loc_cache[key] = loc_id
+    return loc_id
+
+
+def looks_like_datetime(value: str) -> bool:
+    # cheap shape check for '2016-01-01 00:00:17'-style strings; the
+    # cleaner emits exactly this format and MySQL re-validates on insert,
+    # so a strptime/strftime round trip per row is wasted work
+    return (
+        value is not None and len(value) == 19
+        and value[4] == '-' and value[7] == '-'
+        and value[10] == ' ' and value[13] == ':' and value[16] == ':'
+    )
+
+
+# Columns the staging table keeps from the cleaned CSV; anything else in
+# the header (derived features like hour_of_day) is skipped on load.
+STAGING_COLUMNS = {
+    'id': 'VARCHAR(20)',
+    'vendor_id': 'INT',
+    'pickup_datetime': 'DATETIME',
+    'dropoff_datetime': 'DATETIME',
+    'passenger_count': 'INT',
+    'pickup_longitude': 'DECIMAL(10,7)',
+    'pickup_latitude': 'DECIMAL(10,7)',
+    'dropoff_longitude': 'DECIMAL(10,7)',
+    'dropoff_latitude': 'DECIMAL(10,7)',
+    'store_and_fwd_flag': 'CHAR(1)',
+    'trip_duration': 'INT',
+}
+
+
+def load_data_infile(csv_path: str):
+    """Bulk-load via LOAD DATA LOCAL INFILE plus set-based INSERT ... SELECT.
+
+    MySQL parses the CSV in native code directly into a staging table, then
+    vendors, locations and trips are filled with three set-based statements
+    instead of per-row Python parsing and executemany batches. Requires
+    local_infile enabled on the server (SET GLOBAL local_infile=1).
+    """
+    if not os.path.isfile(csv_path):
+        print(f"CSV not found: {csv_path}")
+        sys.exit(1)
+
+    with open(csv_path, 'r', newline='') as f:
+        header = next(csv.reader(f))
+
+    # map each CSV column to a user variable; extra columns land in
+    # throwaway variables, staged columns get NULLIF('') so empty CSV
+    # fields become NULL instead of zero
+    var_list = ', '.join(
+        f'@{col}' if col in STAGING_COLUMNS else f'@skip{i}'
+        for i, col in enumerate(header)
+    )
+    set_clause = ', '.join(
+        f"{col} = NULLIF(@{col}, '')"
+        for col in header if col in STAGING_COLUMNS
+    )
+
+    conn = get_db_connection(local_infile=True)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("DROP TEMPORARY TABLE IF EXISTS staging_trips")
+            cursor.execute(
+                "CREATE TEMPORARY TABLE staging_trips (\n    "
+                + ",\n    ".join(f"{col} {ddl}" for col, ddl in STAGING_COLUMNS.items())
+                + "\n)"
+            )
+
+            print(f"Loading {csv_path} into staging table...")
+            cursor.execute(
+                f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE staging_trips
+                FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+                LINES TERMINATED BY '\\n'
+                IGNORE 1 LINES
+                ({var_list})
+                SET {set_clause}
+                """,
+                (csv_path,)
+            )
+            staged = cursor.rowcount
+            print(f"Staged {staged} rows")
+
+            # one set-based DELETE applies the same validations the row
+            # loader does per row in Python; MySQL evaluates the whole
+            # predicate natively during the scan
+            cursor.execute(
+                """
+                DELETE FROM staging_trips
+                WHERE id IS NULL
+                   OR vendor_id IS NULL
+                   OR pickup_datetime IS NULL
+                   OR dropoff_datetime IS NULL
+                   OR pickup_longitude IS NULL OR pickup_latitude IS NULL
+                   OR dropoff_longitude IS NULL OR dropoff_latitude IS NULL
+                   OR trip_duration IS NULL OR trip_duration <= 0
+                """
+            )
+            if cursor.rowcount:
+                print(f"Removed {cursor.rowcount} invalid staged rows")
+
+            cursor.execute(
+                """
+                INSERT IGNORE INTO vendors (vendor_id)
+                SELECT DISTINCT vendor_id FROM staging_trips
+                WHERE vendor_id IS NOT NULL
+                """
+            )
+
+            cursor.execute(
+                """
+                INSERT IGNORE INTO locations (longitude, latitude)
+                SELECT DISTINCT longitude, latitude FROM (
+                    SELECT pickup_longitude AS longitude,
+                           pickup_latitude AS latitude
+                    FROM staging_trips
+                    UNION
+                    SELECT dropoff_longitude, dropoff_latitude
+                    FROM staging_trips
+                ) coords
+                WHERE longitude IS NOT NULL AND latitude IS NOT NULL
+                """
+            )
+
+            # only after vendors and locations are in place: the INSERT
+            # IGNORE above dedupes against pre-existing locations through
+            # the uq_long_lat index, which unique_checks=0 would let
+            # InnoDB skip - duplicate coordinate rows would then fan out
+            # the joins below and multiply staged rows into trips
+            _relax_bulk_checks(cursor)
+
+            cursor.execute(
+                """
+                INSERT INTO trips (
+                    trip_id, vendor_id, pickup_time, dropoff_time,
+                    pickup_location_id, dropoff_location_id,
+                    passenger_count, store_and_fwd_flag, trip_duration
+                )
+                SELECT
+                    s.id, s.vendor_id, s.pickup_datetime, s.dropoff_datetime,
+                    pl.location_id, dl.location_id,
+                    COALESCE(s.passenger_count, 1),
+                    COALESCE(s.store_and_fwd_flag, 'N'),
+                    s.trip_duration
+                FROM staging_trips s
+                JOIN locations pl
+                  ON pl.longitude = s.pickup_longitude
+                 AND pl.latitude = s.pickup_latitude
+                JOIN locations dl
+                  ON dl.longitude = s.dropoff_longitude
+                 AND dl.latitude = s.dropoff_latitude
+                ON DUPLICATE KEY UPDATE
+                  vendor_id=VALUES(vendor_id),
+                  pickup_time=VALUES(pickup_time),
+                  dropoff_time=VALUES(dropoff_time),
+                  pickup_location_id=VALUES(pickup_location_id),
+                  dropoff_location_id=VALUES(dropoff_location_id),
+                  passenger_count=VALUES(passenger_count),
+                  store_and_fwd_flag=VALUES(store_and_fwd_flag),
+                  trip_duration=VALUES(trip_duration)
+                """
+            )
+            inserted = cursor.rowcount
+            cursor.execute("DROP TEMPORARY TABLE staging_trips")
+            _restore_bulk_checks(cursor)
+
+        conn.commit()
+        print(f"Done. Total trips processed: {inserted}")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error during load, transaction rolled back: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+TRIPS_UPSERT_SQL = """
+    INSERT INTO trips (
+        trip_id, vendor_id, pickup_time, dropoff_time,
+        pickup_location_id, dropoff_location_id,
+        passenger_count, store_and_fwd_flag, trip_duration
+    ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON DUPLICATE KEY UPDATE
+      vendor_id=VALUES(vendor_id),
+      pickup_time=VALUES(pickup_time),
+      dropoff_time=VALUES(dropoff_time),
+      pickup_location_id=VALUES(pickup_location_id),
+      dropoff_location_id=VALUES(dropoff_location_id),
+      passenger_count=VALUES(passenger_count),
+      store_and_fwd_flag=VALUES(store_and_fwd_flag),
+      trip_duration=VALUES(trip_duration)
+"""
+
+
+def _relax_bulk_checks(cursor):
+    # session-scoped, so nothing to restore on error paths: the session
+    # dies with the connection. The cleaned CSV is already validated and
+    # vendors/locations are inserted first, so skipping these checks
+    # during the bulk insert is safe.
+    cursor.execute("SET SESSION unique_checks=0, foreign_key_checks=0")
+
+
+def _restore_bulk_checks(cursor):
+    cursor.execute("SET SESSION unique_checks=1, foreign_key_checks=1")
+
+
+def _open_arrow_reader(csv_path: str):
+    return pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=32 << 20),
+        convert_options=pa_csv.ConvertOptions(column_types={
+            'id': pa.string(),
+            'vendor_id': pa.int32(),
+            'passenger_count': pa.int32(),
+            'pickup_longitude': pa.float64(),
+            'pickup_latitude': pa.float64(),
+            'dropoff_longitude': pa.float64(),
+            'dropoff_latitude': pa.float64(),
+            'store_and_fwd_flag': pa.string(),
+            'trip_duration': pa.float64(),
+        })
+    )
+
+
+def _batch_to_params(batch, cursor, loc_cache, known_vendors):
+    """Coerce one typed pyarrow record batch into TRIPS_UPSERT_SQL params.
+
+    The row validations run as a single NumPy mask over the batch; only
+    surviving rows are zipped into parameter tuples.
+    """
+    names = batch.schema.names
+
+    def col(name):
+        return batch.column(names.index(name)).to_numpy(zero_copy_only=False)
+
+    ids = col('id')
+    vendor = col('vendor_id').astype('float64')
+    pickup = col('pickup_datetime').astype('datetime64[s]')
+    dropoff = col('dropoff_datetime').astype('datetime64[s]')
+    pcount = col('passenger_count').astype('float64')
+    plon = np.round(col('pickup_longitude'), 7)
+    plat = np.round(col('pickup_latitude'), 7)
+    dlon = np.round(col('dropoff_longitude'), 7)
+    dlat = np.round(col('dropoff_latitude'), 7)
+    flags = col('store_and_fwd_flag')
+    duration = col('trip_duration').astype('float64')
+
+    # same validations as the row loader, as one batch mask
+    valid = (
+        np.not_equal(ids, None)
+        & ~np.isnan(vendor)
+        & ~np.isnat(pickup) & ~np.isnat(dropoff)
+        & ~np.isnan(plon) & ~np.isnan(plat)
+        & ~np.isnan(dlon) & ~np.isnan(dlat)
+        & (np.nan_to_num(duration) > 0)
+    )
+
+    rows = zip(
+        ids[valid],
+        vendor[valid].astype('int64'),
+        pickup[valid].tolist(),
+        dropoff[valid].tolist(),
+        plon[valid], plat[valid],
+        dlon[valid], dlat[valid],
+        np.nan_to_num(pcount[valid], nan=1).astype('int64'),
+        flags[valid],
+        duration[valid].astype('int64'),
     )
-    row = cursor.fetchone()
-    if row:
-        return int(row['location_id'])
 
-    cursor.execute(
-        "INSERT INTO locations (longitude, latitude) VALUES (%s, %s)",
-        (lon, lat)
+    params = []
+    for (trip_id, vendor_id, pickup_dt, dropoff_dt,
+         p_lon, p_lat, d_lon, d_lat,
+         passenger_count, store_flag, trip_duration) in rows:
+        vendor_id = int(vendor_id)
+        if vendor_id not in known_vendors:
+            ensure_vendor(cursor, vendor_id)
+            known_vendors.add(vendor_id)
+        pickup_loc_id = get_or_create_location(
+            cursor, loc_cache, float(p_lon), float(p_lat))
+        dropoff_loc_id = get_or_create_location(
+            cursor, loc_cache, float(d_lon), float(d_lat))
+
+        params.append((
+            trip_id,
+            vendor_id,
+            pickup_dt,
+            dropoff_dt,
+            pickup_loc_id,
+            dropoff_loc_id,
+            int(passenger_count),
+            (store_flag or 'N')[:1],
+            int(trip_duration)
+        ))
+    return params
+
+
+def load_data_arrow(csv_path: str, batch_size: int = 20000, limit: Optional[int] = None):
+    """Stream the CSV through pyarrow record batches with vectorized coercion.
+
+    Each batch arrives already typed (floats, ints, datetime64), so no
+    per-row string parsing happens in Python.
+    """
+    conn = get_db_connection()
+    inserted_trips = 0
+    total_taken = 0
+
+    try:
+        with conn.cursor() as cursor:
+            loc_cache = preload_locations(cursor)
+            known_vendors = preload_vendors(cursor)
+            _relax_bulk_checks(cursor)
+
+            reader = _open_arrow_reader(csv_path)
+
+            batch_params = []
+            for batch in reader:
+                if limit is not None and total_taken >= limit:
+                    break
+
+                params = _batch_to_params(batch, cursor, loc_cache, known_vendors)
+                if limit is not None:
+                    params = params[:limit - total_taken]
+                total_taken += len(params)
+                batch_params.extend(params)
+
+                if len(batch_params) >= batch_size:
+                    cursor.executemany(TRIPS_UPSERT_SQL, batch_params)
+                    conn.commit()
+                    inserted_trips += len(batch_params)
+                    print(f"Inserted/updated {inserted_trips} trips...")
+                    batch_params = []
+
+            if batch_params:
+                cursor.executemany(TRIPS_UPSERT_SQL, batch_params)
+                conn.commit()
+                inserted_trips += len(batch_params)
+                print(f"Inserted/updated {inserted_trips} trips (final batch)")
+
+            _restore_bulk_checks(cursor)
+
+        print(f"Done. Total trips processed: {inserted_trips}")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error during load, transaction rolled back: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+# Per-process state for the parallel ingest workers; populated by the
+# pool initializer so each worker owns one connection and private caches.
+_worker_state = {}
+
+
+def _init_ingest_worker():
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    _worker_state['conn'] = conn
+    _worker_state['cursor'] = cursor
+    _worker_state['loc_cache'] = preload_locations(cursor)
+    _worker_state['known_vendors'] = preload_vendors(cursor)
+    # unique_checks stays ON here: concurrent workers rely on the
+    # uq_long_lat index (via INSERT IGNORE) to dedupe new locations
+    cursor.execute("SET SESSION foreign_key_checks=0")
+
+
+def _ingest_batch(batch) -> int:
+    conn = _worker_state['conn']
+    cursor = _worker_state['cursor']
+    params = _batch_to_params(
+        batch, cursor,
+        _worker_state['loc_cache'], _worker_state['known_vendors']
     )
-    return cursor.lastrowid
+    if params:
+        cursor.executemany(TRIPS_UPSERT_SQL, params)
+        conn.commit()
+    return len(params)
+
+
+def load_data_parallel(csv_path: str, workers: int):
+    """Fan record batches out to worker processes, each with its own
+    connection, so Python-side coercion and MySQL inserts overlap across
+    cores. trip_id is the primary key and the upsert is idempotent, so
+    concurrent batches cannot conflict with each other.
+    """
+    reader = _open_arrow_reader(csv_path)
+    inserted_trips = 0
 
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_ingest_worker) as pool:
+        in_flight = []
+        for batch in reader:
+            in_flight.append(pool.submit(_ingest_batch, batch))
+            # keep a bounded window so batches are not all held in memory
+            while len(in_flight) >= workers * 2:
+                inserted_trips += in_flight.pop(0).result()
+                print(f"Inserted/updated {inserted_trips} trips...")
+        for future in in_flight:
+            inserted_trips += future.result()
 
-def parse_datetime(value: str) -> datetime:
-    # incoming format like '2016-01-01 00:00:17'
-    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    print(f"Done. Total trips processed: {inserted_trips}")
 
 
-def load_data(csv_path: str, batch_size: int = 2000, limit: Optional[int] = None):
+def load_data(csv_path: str, batch_size: int = 20000, limit: Optional[int] = None):
     if not os.path.isfile(csv_path):
         print(f"CSV not found: {csv_path}")
         sys.exit(1)
 
+    if pa is not None:
+        return load_data_arrow(csv_path, batch_size=batch_size, limit=limit)
+
     conn = get_db_connection()
     inserted_trips = 0
 
@@ -85,6 +530,12 @@ def load_data(csv_path: str, batch_size: int = 2000, limit: Optional[int] = None
         with conn.cursor() as cursor, open(csv_path, 'r', newline='') as f:
             reader = csv.DictReader(f)
 
+            # known coordinates resolve with a dict lookup; only genuinely
+            # new pairs cost an INSERT round trip
+            loc_cache = preload_locations(cursor)
+            known_vendors = preload_vendors(cursor)
+            _relax_bulk_checks(cursor)
+
             batch_params = []
             total_seen = 0
 
@@ -118,12 +569,7 @@ def load_data(csv_path: str, batch_size: int = 2000, limit: Optional[int] = None
                 # basic validations to align with schema constraints
                 if vendor_id is None:
                     continue
-                if not pickup_time_str or not dropoff_time_str:
-                    continue
-                try:
-                    pickup_dt = parse_datetime(pickup_time_str)
-                    dropoff_dt = parse_datetime(dropoff_time_str)
-                except ValueError:
+                if not looks_like_datetime(pickup_time_str) or not looks_like_datetime(dropoff_time_str):
                     continue
 
                 try:
@@ -142,15 +588,17 @@ def load_data(csv_path: str, batch_size: int = 2000, limit: Optional[int] = None
                     continue
 
                 # ensure vendor and locations exist; we rely on transactional batches
-                ensure_vendor(cursor, vendor_id)
-                pickup_loc_id = get_or_create_location(cursor, pickup_lon, pickup_lat)
-                dropoff_loc_id = get_or_create_location(cursor, dropoff_lon, dropoff_lat)
+                if vendor_id not in known_vendors:
+                    ensure_vendor(cursor, vendor_id)
+                    known_vendors.add(vendor_id)
+                pickup_loc_id = get_or_create_location(cursor, loc_cache, pickup_lon, pickup_lat)
+                dropoff_loc_id = get_or_create_location(cursor, loc_cache, dropoff_lon, dropoff_lat)
 
                 batch_params.append((
                     trip_id,
                     vendor_id,
-                    pickup_dt.strftime('%Y-%m-%d %H:%M:%S'),
-                    dropoff_dt.strftime('%Y-%m-%d %H:%M:%S'),
+                    pickup_time_str,
+                    dropoff_time_str,
                     pickup_loc_id,
                     dropoff_loc_id,
                     passenger_count,
@@ -159,54 +607,20 @@ def load_data(csv_path: str, batch_size: int = 2000, limit: Optional[int] = None
                 ))
 
                 if len(batch_params) >= batch_size:
-                    cursor.executemany(
-                        """
-                        INSERT INTO trips (
-                            trip_id, vendor_id, pickup_time, dropoff_time,
-                            pickup_location_id, dropoff_location_id,
-                            passenger_count, store_and_fwd_flag, trip_duration
-                        ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                        ON DUPLICATE KEY UPDATE
-                          vendor_id=VALUES(vendor_id),
-                          pickup_time=VALUES(pickup_time),
-                          dropoff_time=VALUES(dropoff_time),
-                          pickup_location_id=VALUES(pickup_location_id),
-                          dropoff_location_id=VALUES(dropoff_location_id),
-                          passenger_count=VALUES(passenger_count),
-                          store_and_fwd_flag=VALUES(store_and_fwd_flag),
-                          trip_duration=VALUES(trip_duration)
-                        """,
-                        batch_params
-                    )
+                    cursor.executemany(TRIPS_UPSERT_SQL, batch_params)
                     conn.commit()
                     inserted_trips += len(batch_params)
                     print(f"Inserted/updated {inserted_trips} trips...")
                     batch_params = []
 
             if batch_params:
-                cursor.executemany(
-                    """
-                    INSERT INTO trips (
-                        trip_id, vendor_id, pickup_time, dropoff_time,
-                        pickup_location_id, dropoff_location_id,
-                        passenger_count, store_and_fwd_flag, trip_duration
-                    ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                    ON DUPLICATE KEY UPDATE
-                      vendor_id=VALUES(vendor_id),
-                      pickup_time=VALUES(pickup_time),
-                      dropoff_time=VALUES(dropoff_time),
-                      pickup_location_id=VALUES(pickup_location_id),
-                      dropoff_location_id=VALUES(dropoff_location_id),
-                      passenger_count=VALUES(passenger_count),
-                      store_and_fwd_flag=VALUES(store_and_fwd_flag),
-                      trip_duration=VALUES(trip_duration)
-                    """,
-                    batch_params
-                )
+                cursor.executemany(TRIPS_UPSERT_SQL, batch_params)
                 conn.commit()
                 inserted_trips += len(batch_params)
                 print(f"Inserted/updated {inserted_trips} trips (final batch)")
 
+            _restore_bulk_checks(cursor)
+
         print(f"Done. Total trips processed: {inserted_trips}")
     except Exception as e:
         conn.rollback()
@@ -219,12 +633,25 @@ def load_data(csv_path: str, batch_size: int = 2000, limit: Optional[int] = None
 def main():
     parser = argparse.ArgumentParser(description='Load cleaned NYC taxi data to MySQL')
     parser.add_argument('--csv', default=os.path.join(os.path.dirname(__file__), '..', 'data', 'cleaned_train_data.csv'))
-    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=20000)
     parser.add_argument('--limit', type=int, default=None, help='For testing, only load first N rows')
+    parser.add_argument('--use-infile', action='store_true',
+                        help='Bulk-load via LOAD DATA LOCAL INFILE (requires local_infile on the server)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallel ingest processes (requires pyarrow; ignores --limit)')
     args = parser.parse_args()
 
     csv_path = os.path.abspath(args.csv)
-    load_data(csv_path, batch_size=args.batch_size, limit=args.limit)
+    if args.workers > 1 and pa is not None and not args.use_infile and args.limit is None:
+        load_data_parallel(csv_path, workers=args.workers)
+    elif args.use_infile:
+        if args.limit is not None:
+            print("--limit is not supported with --use-infile; falling back to the row loader")
+            load_data(csv_path, batch_size=args.batch_size, limit=args.limit)
+        else:
+            load_data_infile(csv_path)
+    else:
+        load_data(csv_path, batch_size=args.batch_size, limit=args.limit)
 
 
 if __name__ == '__main__':